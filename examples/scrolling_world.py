@@ -0,0 +1,24 @@
+import ImgGameLib as igl
+
+# The world is much wider than what the camera shows
+canvas = igl.TiledCanvas(8000, 800, 800, 800, bg_color="#99CDDE", gif=True)
+
+ground = igl.Rectangle(0, 700, 8000, 100, fill="green", rigidbody=True)
+ground.draw(canvas)
+
+# Some platforms along the level
+for x in range(600, 8000, 900):
+    platform = igl.Rectangle(x, 500, 200, 30, fill="brown")
+    platform.draw(canvas)
+
+player = igl.Rectangle(100, 620, 30, 80, fill="red")
+player.draw(canvas)
+
+# The camera stays centered on the player as it runs through the level
+canvas.follow(player)
+canvas.discard_frames()
+
+for _ in range(150):
+    player.move(x=20)
+
+canvas.save("game.gif", duration=20)
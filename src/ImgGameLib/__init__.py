@@ -1,4 +1,5 @@
 from .canvas import Canvas
+from .tiled_canvas import TiledCanvas
 from .rectangle import Rectangle
 from .sprite import Sprite
 from . import constants
@@ -60,10 +60,14 @@ class Canvas:
         """Displays the image."""
         if self.gif:
             raise ValueError("Displaying gifs is not supported yet.")
-        self._im.show()
+        self._render().show()
     
+    def _render(self) -> Image.Image:
+        """Returns an image of what the canvas currently shows."""
+        return self._im.copy()
+
     def _append_frame(self) -> None:
-        self.gif_frames.append(self._im.copy())
+        self.gif_frames.append(self._render())
 
     def _draw_rectangle(self, rect: "Rectangle") -> None:
         self._draw.rectangle(
@@ -77,14 +81,15 @@ class Canvas:
     
     def _draw_sprite(self, sprite: "Sprite") -> None:
         if sprite.sprite.mode == "RGBA":
-            the_sprite = Image.new(
-                mode="RGBA",
-                size=(self.width, self.height),
-                color=(0, 0, 0, 0)
-            )
-            the_sprite.paste(sprite.sprite, (sprite.x1, sprite.y1, sprite.x2, sprite.y2))
-            self._im = Image.alpha_composite(self._im, the_sprite)
-            self._draw: ImageDraw.ImageDraw = ImageDraw.Draw(self._im)
+            # Only composite the part of the canvas the sprite covers
+            left, top = max(sprite.x1, 0), max(sprite.y1, 0)
+            right, bottom = min(sprite.x2, self.width), min(sprite.y2, self.height)
+            if left < right and top < bottom:
+                self._im.alpha_composite(
+                    sprite.sprite,
+                    dest=(left, top),
+                    source=(left - sprite.x1, top - sprite.y1, right - sprite.x1, bottom - sprite.y1)
+                )
         else:
             self._im.paste(
                 sprite.sprite,
@@ -198,4 +203,4 @@ class Canvas:
                 raise ValueError("Images that aren't gifs cannot loop.")
             if duration:
                 raise ValueError("Images that aren't gifs cannot have a set duration.")
-            self._im.save(save_file, format=filetype)
+            self._render().save(save_file, format=filetype)
@@ -0,0 +1,209 @@
+from typing import Dict, Iterator, Optional, Tuple, Union
+from PIL import Image, ImageColor, ImageDraw
+
+from .canvas import Canvas
+
+class TiledCanvas(Canvas):
+    """A canvas for very large worlds, which is viewed through a movable camera.
+
+    The world is stored as square tiles which are only created once something is drawn on them, and drawing only touches the tiles it overlaps.
+    Saved images and gif frames are the size of the viewport rather than the size of the world.
+
+    Methods:
+        - erase
+        - show
+        - discard_frames
+        - copy
+        - set_camera
+        - move_camera
+        - follow
+        - register_rigidbody
+        - check_collision
+        - check_outofbounds
+        - save
+    """
+    def __init__(self, width, height, viewport_width, viewport_height, bg_color: Union[tuple, str]="white", gif: bool=False, tile_size: int=256) -> None:
+        """Initializes a tiled canvas.
+
+        Required Parameters:
+            - width: int - the width of the world
+            - height: int - the height of the world
+            - viewport_width: int - the width of the camera's view, and of the saved images
+            - viewport_height: int - the height of the camera's view, and of the saved images
+
+        Optional Parameters:
+            - bg_color: Union[tuple, str] - the background color of the canvas
+            - gif: bool - whether a gif should be saved instead of a normal image
+            - tile_size: int - the width and height of each tile
+        """
+        if tile_size <= 0:
+            raise ValueError("The tile size must be positive.")
+
+        self.bg_color = bg_color
+        self.width = width
+        self.height = height
+        self.viewport_width = viewport_width
+        self.viewport_height = viewport_height
+        self.tile_size = tile_size
+        self.gif = gif
+
+        self.camera_x = 0
+        self.camera_y = 0
+        self.following: Optional["Drawable"] = None
+
+        self._bg = ImageColor.getrgb(self.bg_color)
+        self._tiles: Dict[Tuple[int, int], Image.Image] = {}
+
+        if self.gif:
+            self.gif_frames = [self._render()]
+
+        self.rigidbodies = {
+            "rect": [],
+        }
+
+    def _tiles_in(self, x1, y1, x2, y2) -> Iterator[Tuple[Tuple[int, int], int, int]]:
+        # Yields the key and the world coordinates of the top left of every tile
+        # overlapping the box, where x2 and y2 are exclusive
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, self.width), min(y2, self.height)
+        if x1 >= x2 or y1 >= y2:
+            return
+        size = self.tile_size
+        for ty in range(int(y1 // size), int((y2 - 1) // size) + 1):
+            for tx in range(int(x1 // size), int((x2 - 1) // size) + 1):
+                yield (tx, ty), tx * size, ty * size
+
+    def _tile(self, key: Tuple[int, int], x: int, y: int) -> Image.Image:
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = Image.new(
+                mode="RGBA",
+                size=(min(self.tile_size, self.width - x), min(self.tile_size, self.height - y)),
+                color=self._bg
+            )
+            self._tiles[key] = tile
+        return tile
+
+    def erase(self, x1, y1, x2, y2) -> None:
+        """Erases a selection of the image, with the selection being a rectangle.
+
+        Parameters:
+            - x1 - the top left x of the rectangular selection
+            - y1 - the top left y of the rectangular selection
+            - x2 - the bottom right x of the rectangular selection
+            - y2 - the bottom right y of the rectangular selection
+        """
+        for key, x, y in self._tiles_in(x1, y1, x2 + 1, y2 + 1):
+            tile = self._tiles.get(key)
+            if tile is None:
+                # Tiles which were never drawn on are already blank
+                continue
+            if x1 <= x and y1 <= y and x2 + 1 >= x + tile.width and y2 + 1 >= y + tile.height:
+                del self._tiles[key]
+            else:
+                ImageDraw.Draw(tile).rectangle((x1 - x, y1 - y, x2 - x, y2 - y), outline=None, fill=self._bg)
+
+    def _render(self) -> Image.Image:
+        """Returns an image of what the camera currently sees."""
+        if self.following is not None:
+            self._center_camera(self.following)
+
+        view = Image.new(
+            mode="RGBA",
+            size=(self.viewport_width, self.viewport_height),
+            color=self._bg
+        )
+        for key, x, y in self._tiles_in(self.camera_x, self.camera_y, self.camera_x + self.viewport_width, self.camera_y + self.viewport_height):
+            tile = self._tiles.get(key)
+            if tile is not None:
+                view.paste(tile, (x - self.camera_x, y - self.camera_y))
+        return view
+
+    def _draw_rectangle(self, rect: "Rectangle") -> None:
+        for key, x, y in self._tiles_in(rect.x1, rect.y1, rect.x2 + 1, rect.y2 + 1):
+            ImageDraw.Draw(self._tile(key, x, y)).rectangle(
+                (rect.x1 - x, rect.y1 - y, rect.x2 - x, rect.y2 - y),
+                outline=rect.border,
+                fill=rect.fill,
+                width=rect.border_thickness
+            )
+        if self.gif:
+            self._append_frame()
+
+    def _draw_sprite(self, sprite: "Sprite") -> None:
+        for key, x, y in self._tiles_in(sprite.x1, sprite.y1, sprite.x2, sprite.y2):
+            tile = self._tile(key, x, y)
+            left, top = max(sprite.x1, x), max(sprite.y1, y)
+            right, bottom = min(sprite.x2, x + tile.width), min(sprite.y2, y + tile.height)
+            source = (left - sprite.x1, top - sprite.y1, right - sprite.x1, bottom - sprite.y1)
+            if sprite.sprite.mode == "RGBA":
+                tile.alpha_composite(sprite.sprite, dest=(left - x, top - y), source=source)
+            else:
+                tile.paste(sprite.sprite.crop(source), (left - x, top - y))
+
+        if self.gif:
+            self._append_frame()
+
+    def copy(self):
+        cp = TiledCanvas(
+            width=self.width,
+            height=self.height,
+            viewport_width=self.viewport_width,
+            viewport_height=self.viewport_height,
+            bg_color=self.bg_color,
+            gif=self.gif,
+            tile_size=self.tile_size
+        )
+        cp._tiles = {key: tile.copy() for key, tile in self._tiles.items()}
+        cp.camera_x = self.camera_x
+        cp.camera_y = self.camera_y
+        cp.following = self.following
+
+        if self.gif:
+            cp.gif_frames = [self.gif_frames[i].copy() for i in range(len(self.gif_frames))]
+        return cp
+
+    def discard_frames(self) -> None:
+        """Gets rid of all previous frames of the animation."""
+        if not self.gif:
+            raise ValueError("This function is not applicable for images.")
+        self.gif_frames = [self.gif_frames[-1]]
+
+    def _set_camera(self, x: int, y: int) -> None:
+        # The camera is kept inside of the world
+        self.camera_x = max(0, min(round(x), self.width - self.viewport_width))
+        self.camera_y = max(0, min(round(y), self.height - self.viewport_height))
+
+    def _center_camera(self, drawable: "Drawable") -> None:
+        center_x, center_y = drawable.center()
+        self._set_camera(center_x - self.viewport_width/2, center_y - self.viewport_height/2)
+
+    def set_camera(self, x: int, y: int) -> None:
+        """Moves the top left of the camera to some x and y in the world. The camera cannot leave the world.
+
+        Parameters:
+            - x: int - the left x of the camera
+            - y: int - the top y of the camera
+        """
+        if self.following is not None:
+            raise ValueError("The camera cannot be moved while it is following something.")
+        self._set_camera(x, y)
+        if self.gif:
+            self._append_frame()
+
+    def move_camera(self, x: int=0, y: int=0) -> None:
+        """Move the camera by some x and y. The camera cannot leave the world.
+
+        Parameters:
+            - x: int - the amount by which to increment the x
+            - y: int - the amount by which to increment the y
+        """
+        self.set_camera(self.camera_x + x, self.camera_y + y)
+
+    def follow(self, drawable: Optional["Drawable"]) -> None:
+        """Keeps the camera centered on a drawable whenever a frame or image is made.
+
+        Parameters:
+            - drawable: Optional[Drawable] - the drawable to follow, or None to stop following
+        """
+        self.following = drawable